@@ -3,13 +3,27 @@
 Interview Prep Progress Tracker - Interactive Dashboard
 """
 
+import atexit
+import functools
 import json
+import mmap
+import os
 import random
+import shlex
+import shutil
 import subprocess
 import tempfile
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json
+    orjson = None
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, VerticalScroll
@@ -21,103 +35,304 @@ from textual.widgets import (
 )
 from textual.binding import Binding
 from textual.screen import Screen, ModalScreen
-from textual import on
+from textual import on, work
+from textual.worker import get_current_worker
+
+
+# Pre-rendered text progress bars, indexed by number of filled cells
+_BAR15 = ["█" * i + "░" * (15 - i) for i in range(16)]
+_BAR10 = ["█" * i + "░" * (10 - i) for i in range(11)]
+
+# Glyphs indexed by a bool (False -> 0, True -> 1)
+_STATUS = ("", "✓")
+_CHECKBOX = ("[ ]", "[✓]")
+_COMPLETE_MARK = ("", " ✓")
+
+# Turns a problem name into a safe solution filename
+_FILENAME_TRANS = str.maketrans({
+    ' ': '_', '/': '_', '\\': '_', ':': '_', '*': '_', '?': '_', '|': '_',
+    '(': None, ')': None, '"': None, '<': None, '>': None,
+})
+
+
+def _pct(done: int, target: int) -> int:
+    """Integer percentage of done/target, 0 when there is no target"""
+    return done * 100 // target if target > 0 else 0
+
+
+@functools.lru_cache(maxsize=1)
+def _editor_cmd() -> Tuple[str, ...]:
+    """Editor command from $EDITOR (default vim), resolved on PATH on first use"""
+    try:
+        cmd = shlex.split(os.environ.get("EDITOR", ""))
+    except ValueError:  # Unbalanced quotes
+        cmd = []
+    cmd = cmd or ["vim"]
+    cmd[0] = shutil.which(cmd[0]) or cmd[0]
+    return tuple(cmd)
 
 
 class ProgressData:
     """Manages progress data loading and saving"""
 
+    MMAP_THRESHOLD = 64 * 1024  # Below this, a plain read() is cheaper than setting up a mapping
+
+    __slots__ = (
+        "filepath", "data", "schedule_write",
+        "_mtime", "_last_serialized", "_pending_blob", "_pending_lock", "_write_lock",
+        "_phase_by_id", "_topic_by_name", "_problem_names", "_module_by_name", "_systems_topics",
+        "_module_completed",
+        "_stats_cache", "_dirty_phase_ids",
+    )
+
     def __init__(self, filepath: str = "progress.json"):
         self.filepath = Path(__file__).parent / filepath
         self.data = self.load()
+        self.rebuild_indices()
+        # When set, save() hands the disk write to this callback instead of doing it inline
+        self.schedule_write: Optional[Callable[[], Any]] = None
+        self._pending_blob: Optional[bytes] = None
+        # Guards handing _pending_blob between save() and a flush() on the writer thread
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def rebuild_indices(self):
+        """Walk the loaded data once: build lookup maps and recount totals"""
+        self._phase_by_id = {}
+        self._topic_by_name = {}
+        # Per-topic sets of problem names, built the first time a topic is added to
+        self._problem_names = {}
+        leetcode = self.data['leetcode']
+        total_solved = 0
+        for phase in leetcode['phases']:
+            phase_id = phase['id']
+            self._phase_by_id[phase_id] = phase
+            phase_solved = 0
+            for topic in phase['topics']:
+                topic_name = topic['name']
+                self._topic_by_name[(phase_id, topic_name)] = topic
+                # Counts on disk may be stale after hand edits; the problem lists are authoritative
+                topic['solved'] = len(topic['problems'])
+                phase_solved += topic['solved']
+            phase['solved'] = phase_solved
+            total_solved += phase_solved
+        leetcode['total_solved'] = total_solved
+        # Every phase may differ from what is on screen after a (re)load
+        self._dirty_phase_ids = set(self._phase_by_id)
+
+        self._module_by_name = {}
+        self._systems_topics = {}
+        # Completed-topic count per module, kept current by toggle_systems_topic
+        self._module_completed = {}
+        for module in self.data['systems']['modules']:
+            module_name = module['name']
+            self._module_by_name[module_name] = module
+            completed = 0
+            for topic in module['topics']:
+                self._systems_topics[(module_name, topic['name'])] = topic
+                if topic['completed']:
+                    completed += 1
+            self._module_completed[module_name] = completed
+        self._stats_cache = {}
+
+    def phase_stats(self, phase_id: int) -> Tuple[int, int, int]:
+        """Get (solved, target, percentage) for a phase"""
+        key = ('phase', phase_id)
+        stats = self._stats_cache.get(key)
+        if stats is None:
+            phase = self._phase_by_id[phase_id]
+            solved = phase['solved']
+            target = phase['target']
+            percentage = _pct(solved, target)
+            stats = self._stats_cache[key] = (solved, target, percentage)
+        return stats
+
+    def module_stats(self, module_name: str) -> Tuple[int, int, int]:
+        """Get (completed, total, percentage) for a systems module"""
+        key = ('module', module_name)
+        stats = self._stats_cache.get(key)
+        if stats is None:
+            total = len(self._module_by_name[module_name]['topics'])
+            completed = self._module_completed[module_name]
+            percentage = _pct(completed, total)
+            stats = self._stats_cache[key] = (completed, total, percentage)
+        return stats
+
+    def overall_stats(self) -> Tuple[int, int, int]:
+        """Get (total_solved, total_target, percentage) for LeetCode"""
+        stats = self._stats_cache.get('overall')
+        if stats is None:
+            leetcode = self.data['leetcode']
+            total_solved = leetcode['total_solved']
+            total_target = leetcode['total_target']
+            percentage = _pct(total_solved, total_target)
+            stats = self._stats_cache['overall'] = (total_solved, total_target, percentage)
+        return stats
+
+    def reload(self):
+        """Re-read progress data from disk and rebuild lookup maps"""
+        self.data = self.load()
+        self.rebuild_indices()
+
+    def changed_on_disk(self) -> bool:
+        """Whether the file changed on disk since we last read or wrote it"""
+        return self.filepath.stat().st_mtime_ns != self._mtime
+
+    @property
+    def has_pending_write(self) -> bool:
+        """Whether a save is still waiting to be written to disk"""
+        return self._pending_blob is not None
 
     def load(self) -> Dict:
         """Load progress data from JSON file"""
         if not self.filepath.exists():
             raise FileNotFoundError(f"Progress file(JSON) not found: {self.filepath}")
 
-        with open(self.filepath, 'r') as f:
-            return json.load(f)
+        with open(self.filepath, 'rb') as f:
+            # orjson can parse straight out of a memory map; json.loads needs bytes
+            if orjson is not None and os.fstat(f.fileno()).st_size > self.MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    data = orjson.loads(view)
+            else:
+                raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+        self._mtime = self.filepath.stat().st_mtime_ns
+        self._last_serialized = None
+        return data
 
     def save(self):
         """Save progress data to JSON file"""
         self.data['meta']['last_updated'] = datetime.now().strftime("%Y-%m-%d")
-        with open(self.filepath, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        if orjson is not None:
+            blob = orjson.dumps(self.data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        else:
+            blob = json.dumps(self.data, indent=2).encode('utf-8')
 
-    def add_problem(self, phase_id: int, topic_name: str, problem_name: str):
-        """Add a solved problem to a specific topic"""
-        for phase in self.data['leetcode']['phases']:
-            if phase['id'] == phase_id:
-                for topic in phase['topics']:
-                    if topic['name'] == topic_name:
-                        if problem_name not in topic['problems']:
-                            topic['problems'].append(problem_name)
-                            topic['solved'] = len(topic['problems'])
-                        break
-                # Recalculate phase total
-                phase['solved'] = sum(t['solved'] for t in phase['topics'])
-                break
-
-        # Recalculate total
-        self.data['leetcode']['total_solved'] = sum(p['solved'] for p in self.data['leetcode']['phases'])
+        # Skip the write if nothing changed since the last save
+        if blob == self._last_serialized:
+            return
+
+        self._last_serialized = blob
+        with self._pending_lock:
+            self._pending_blob = blob
+        if self.schedule_write is not None:
+            self.schedule_write()
+        else:
+            self.flush()
+
+    def flush(self):
+        """Write the most recently saved data to disk, if not written yet"""
+        with self._write_lock:
+            with self._pending_lock:
+                blob = self._pending_blob
+            if blob is None:
+                return
+
+            # Write to a temp file and rename so progress.json is never left half-written
+            f = tempfile.NamedTemporaryFile(
+                'wb', dir=self.filepath.parent, prefix=".progress-", suffix=".tmp", delete=False
+            )
+            try:
+                with f:
+                    f.write(blob)
+                # NamedTemporaryFile is created 0600; keep the original file's permissions
+                if self.filepath.exists():
+                    os.chmod(f.name, self.filepath.stat().st_mode & 0o777)
+                os.replace(f.name, self.filepath)
+            except OSError:
+                os.unlink(f.name)
+                raise
+
+            self._mtime = self.filepath.stat().st_mtime_ns
+            # A newer save may have come in while writing; leave it for its own flush
+            with self._pending_lock:
+                if self._pending_blob is blob:
+                    self._pending_blob = None
+
+    def add_problem(self, phase_id: int, topic_name: str, problem_name: str) -> bool:
+        """Add a solved problem to a specific topic. Returns True if it was added."""
+        key = (phase_id, topic_name)
+        topic = self._topic_by_name.get(key)
+        if topic is None:
+            return False
+
+        names = self._problem_names.get(key)
+        if names is None:
+            names = self._problem_names[key] = {
+                p.get('name', '') if isinstance(p, dict) else p for p in topic['problems']
+            }
+        if problem_name in names:
+            return False
+
+        names.add(problem_name)
+        topic['problems'].append(problem_name)
+        phase = self._phase_by_id[phase_id]
+        # Update counters incrementally
+        topic['solved'] += 1
+        phase['solved'] += 1
+        self.data['leetcode']['total_solved'] += 1
+        self._stats_cache.pop(('phase', phase_id), None)
+        self._stats_cache.pop('overall', None)
+        self._dirty_phase_ids.add(phase_id)
         self.save()
+        return True
+
+    def get_phase(self, phase_id: int) -> Dict:
+        """Get a phase by id"""
+        return self._phase_by_id[phase_id]
+
+    def pop_dirty_phase_ids(self) -> Set[int]:
+        """Return the ids of phases changed since the last call, and reset the set"""
+        dirty = self._dirty_phase_ids
+        self._dirty_phase_ids = set()
+        return dirty
 
     def toggle_systems_topic(self, module_name: str, topic_name: str):
         """Toggle completion status of a systems topic"""
-        for module in self.data['systems']['modules']:
-            if module['name'] == module_name:
-                for topic in module['topics']:
-                    if topic['name'] == topic_name:
-                        topic['completed'] = not topic['completed']
-                        self.save()
-                        return topic['completed']
-        return False
+        topic = self._systems_topics.get((module_name, topic_name))
+        if topic is None:
+            return False
+
+        topic['completed'] = not topic['completed']
+        self._module_completed[module_name] += 1 if topic['completed'] else -1
+        self._stats_cache.pop(('module', module_name), None)
+        self.save()
+        return topic['completed']
 
     def get_all_solved_problems(self) -> List[Tuple[str, str, str, str, int]]:
         """Get all solved problems as list of (problem_name, pattern, url, topic_name, phase_name, phase_id)"""
-        solved = []
-        for phase in self.data['leetcode']['phases']:
-            phase_name = phase['name']
-            phase_id = phase['id']
-            for topic in phase['topics']:
-                topic_name = topic['name']
-                for problem in topic['problems']:
-                    # Handle both old string format and new dict format
-                    if isinstance(problem, dict):
-                        problem_name = problem.get('name', '')
-                        pattern = problem.get('pattern', '')
-                        url = problem.get('url', '')
-                    else:
-                        # Old format: "Problem Name; pattern"
-                        parts = problem.split(';')
-                        problem_name = parts[0].strip()
-                        pattern = parts[1].strip() if len(parts) > 1 else ''
-                        url = ''
-
-                    solved.append((problem_name, pattern, url, topic_name, phase_name, phase_id))
-        return solved
-
-    def get_days_since_review(self, phase_id: int, topic_name: str, problem_name: str) -> int:
-        """Get days since last review. Returns 100 if never reviewed."""
-        from datetime import datetime
-
-        for phase in self.data['leetcode']['phases']:
-            if phase['id'] == phase_id:
-                for topic in phase['topics']:
-                    if topic['name'] == topic_name:
-                        for problem in topic['problems']:
-                            if isinstance(problem, dict) and problem.get('name') == problem_name:
-                                last_reviewed = problem.get('last_reviewed')
-                                if not last_reviewed:
-                                    return 100  # Never reviewed
-
-                                # Calculate days since last review
-                                last_date = datetime.strptime(last_reviewed, "%Y-%m-%d")
-                                today = datetime.now()
-                                days = (today - last_date).days
-                                return max(days, 1)  # Minimum 1 day
-        return 100  # Not found or never reviewed
+        return [
+            self._solved_entry(problem, topic['name'], phase['name'], phase['id'])
+            for phase in self.data['leetcode']['phases']
+            for topic in phase['topics']
+            for problem in topic['problems']
+        ]
+
+    @staticmethod
+    def _solved_entry(problem, topic_name: str, phase_name: str, phase_id: int) -> Tuple:
+        """Flatten one stored problem into a get_all_solved_problems tuple"""
+        # Handle both old string format and new dict format
+        if isinstance(problem, dict):
+            problem_name = problem.get('name', '')
+            pattern = problem.get('pattern', '')
+            url = problem.get('url', '')
+        else:
+            # Old format: "Problem Name; pattern"
+            parts = problem.split(';')
+            problem_name = parts[0].strip()
+            pattern = parts[1].strip() if len(parts) > 1 else ''
+            url = ''
+
+        return (problem_name, pattern, url, topic_name, phase_name, phase_id)
+
+    @staticmethod
+    def _review_weight(last_reviewed: Optional[str], today: datetime) -> int:
+        """Selection weight for a problem: days since last review (min 1), 100 if never reviewed"""
+        if not last_reviewed:
+            return 100  # Never reviewed
+        days = (today - datetime.strptime(last_reviewed, "%Y-%m-%d")).days
+        return max(days, 1)  # Minimum 1 day
 
     def update_last_reviewed(self, phase_id: int, topic_name: str, problem_name: str):
         """Update last_reviewed field for a problem"""
@@ -129,133 +344,288 @@ class ProgressData:
                     if topic['name'] == topic_name:
                         for problem in topic['problems']:
                             if isinstance(problem, dict) and problem.get('name') == problem_name:
-                                problem['last_reviewed'] = today
-                                self.save()
+                                # Reviewing twice in one day changes nothing worth serializing
+                                if problem.get('last_reviewed') != today:
+                                    problem['last_reviewed'] = today
+                                    self.save()
                                 return
         # If not found, problem might be old string format - no update needed
 
+    def pick_random_solved(self, exclude_name: Optional[str] = None) -> Optional[Tuple]:
+        """Pick one solved problem weighted by days since review, in a single pass
+
+        Returns a get_all_solved_problems tuple, or None if nothing is solved. The
+        problem named exclude_name is only returned when it is the sole candidate.
+        """
+        today = datetime.now()
+        total_weight = 0
+        chosen = None
+        excluded = None
+        for phase in self.data['leetcode']['phases']:
+            for topic in phase['topics']:
+                for problem in topic['problems']:
+                    if isinstance(problem, dict):
+                        name = problem.get('name', '')
+                        last_reviewed = problem.get('last_reviewed')
+                    else:
+                        name = problem.split(';', 1)[0].strip()
+                        last_reviewed = None
+                    if exclude_name is not None and name == exclude_name:
+                        excluded = (problem, topic['name'], phase['name'], phase['id'])
+                        continue
+                    weight = self._review_weight(last_reviewed, today)
+                    # Weighted reservoir: replace the pick with probability weight/total
+                    total_weight += weight
+                    if random.random() * total_weight < weight:
+                        chosen = (problem, topic['name'], phase['name'], phase['id'])
+        if chosen is None:
+            chosen = excluded
+        return self._solved_entry(*chosen) if chosen else None
+
 
 class CollapsiblePhase(Static):
     """Collapsible widget for a LeetCode phase"""
 
-    def __init__(self, phase: Dict, phase_idx: int, progress_data: ProgressData):
-        super().__init__()
+    __slots__ = (
+        "phase", "phase_idx", "expanded", "_materialized", "_topic_rows", "_topic_keys", "_unfilled_topics",
+        "_last_title_key", "_bar",
+    )
+
+    _TITLE_TMPL = "{name} - {solved}/{target} ({pct}%)"
+    _TOPIC_TMPL = "{name}: {solved}/{target} [{bar}] {status}"
+
+    def __init__(self, phase: Dict, phase_idx: int):
+        super().__init__(id=f"phase_{phase['id']}")
         self.phase = phase
         self.phase_idx = phase_idx
-        self.progress_data = progress_data
         self.expanded = (phase_idx == 0)  # First phase expanded by default
-
-    def compose(self) -> ComposeResult:
+        self._materialized = False
+        self._topic_rows: Dict[str, Any] = {}
+        self._topic_keys: Dict[str, Tuple] = {}
+        # id() of topic rows whose problem list is not rendered yet -> their topic
+        self._unfilled_topics: Dict[int, Dict] = {}
+        self._last_title_key = None
+        self._bar: Optional[ProgressBar] = None
+
+    def _title(self) -> str:
+        """Build the phase title and remember the inputs it was built from"""
         phase = self.phase
-        solved = phase['solved']
-        target = phase['target']
-        percentage = int((solved / target * 100)) if target > 0 else 0
-
-        arrow = "▼" if self.expanded else "▶"
+        solved, target, percentage = self.app.progress_data.phase_stats(phase['id'])
+        self._last_title_key = (phase['name'], solved, target)
+        return self._TITLE_TMPL.format(name=phase['name'], solved=solved, target=target, pct=percentage)
 
+    def compose(self) -> ComposeResult:
         with Collapsible(
-            title=f"{phase['name']} - {solved}/{target} ({percentage}%)",
+            title=self._title(),
             collapsed=not self.expanded,
             classes="phase_collapsible"
         ):
-            # Progress bar
-            bar = ProgressBar(total=target, show_eta=False, classes="phase_progress")
-            bar.update(progress=solved)
-            yield bar
+            # Collapsed phases only get their body once they are first expanded
+            if self.expanded:
+                self._materialized = True
+                yield from self._compose_body()
+            else:
+                yield Static("", classes="placeholder")
 
-            # Topics
-            for topic in phase['topics']:
-                topic_solved = topic['solved']
-                topic_target = topic['target']
-                topic_pct = int((topic_solved / topic_target * 100)) if topic_target > 0 else 0
-
-                bar_length = 15
-                filled = int(bar_length * topic_pct / 100)
-                bar_str = "█" * filled + "░" * (bar_length - filled)
-
-                status = "✓" if topic_solved >= topic_target else ""
-
-                # Show topic with problems if any solved
-                if topic_solved > 0 and topic['problems']:
-                    with Collapsible(
-                        title=f"{topic['name']}: {topic_solved}/{topic_target} [{bar_str}] {status}",
-                        collapsed=True,
-                        classes="topic_collapsible"
-                    ):
-                        for i, problem in enumerate(topic['problems'], 1):
-                            yield Label(f"  {i}. {problem}", classes="problem_item")
-                else:
-                    yield Label(
-                        f"  • {topic['name']}: {topic_solved}/{topic_target} [{bar_str}] {status}",
-                        classes="topic_label"
-                    )
+    def _compose_body(self):
+        """Build the progress bar and topic rows for this phase"""
+        phase = self.phase
+
+        # Progress bar
+        self._bar = ProgressBar(total=phase['target'], show_eta=False, classes="phase_progress")
+        self._bar.update(progress=phase['solved'])
+        yield self._bar
+
+        # Topics
+        for topic in phase['topics']:
+            yield self._make_topic_row(topic)
+
+    @on(Collapsible.Expanded, ".phase_collapsible")
+    def materialize(self):
+        """Mount the phase body on first expansion"""
+        if self._materialized:
+            return
+        self._materialized = True
+        contents = self.query_one(".phase_collapsible", Collapsible).query_one(Collapsible.Contents)
+        contents.query(".placeholder").remove()
+        contents.mount(*self._compose_body())
+
+    @on(Collapsible.Expanded, ".topic_collapsible")
+    def fill_topic(self, event: Collapsible.Expanded):
+        """Render a topic's problem list on first expansion"""
+        row = event.collapsible
+        topic = self._unfilled_topics.pop(id(row), None)
+        if topic is None:
+            return
+        row.query_one(".problem_item", Static).update(
+            "\n".join([f"  {i}. {problem}" for i, problem in enumerate(topic['problems'], 1)])
+        )
+
+    def _make_topic_row(self, topic: Dict):
+        """Build the row widget for a topic and remember it for in-place updates"""
+        name = topic['name']
+        problems = topic['problems']
+        topic_solved = topic['solved']
+        topic_target = topic['target']
+        bar_str = _BAR15[min(15 * topic_solved // topic_target, 15) if topic_target > 0 else 0]
+
+        status = _STATUS[topic_solved >= topic_target]
+
+        title = self._TOPIC_TMPL.format(name=name, solved=topic_solved, target=topic_target, bar=bar_str, status=status)
+
+        # Show topic with problems if any solved
+        if topic_solved > 0 and problems:
+            # One Static for the whole list, filled in by fill_topic when first expanded
+            row = Collapsible(
+                Static("", classes="problem_item"),
+                title=title,
+                collapsed=True,
+                classes="topic_collapsible"
+            )
+            self._unfilled_topics[id(row)] = topic
+        else:
+            row = Label(f"  • {title}", classes="topic_label")
+
+        self._topic_rows[name] = row
+        # The problems themselves are part of the key so hand-edited names are picked up on reload
+        self._topic_keys[name] = (topic_solved, topic_target, tuple(problems))
+        return row
+
+    def update_from_data(self, phase: Dict):
+        """Update title, progress bar and changed topic rows without recomposing"""
+        self.phase = phase
+        solved, target, _ = self.app.progress_data.phase_stats(phase['id'])
+
+        if (phase['name'], solved, target) != self._last_title_key:
+            self.query_one(".phase_collapsible", Collapsible).title = self._title()
+        if not self._materialized:
+            return
+
+        self._bar.update(total=target, progress=solved)
+
+        for topic in phase['topics']:
+            key = (topic['solved'], topic['target'], tuple(topic['problems']))
+            if self._topic_keys.get(topic['name']) == key:
+                continue
+            old_row = self._topic_rows[topic['name']]
+            new_row = self._make_topic_row(topic)
+            self._unfilled_topics.pop(id(old_row), None)
+            old_row.parent.mount(new_row, after=old_row)
+            old_row.remove()
 
 
 class CollapsibleSystemsModule(Static):
     """Collapsible widget for a Systems module"""
 
-    def __init__(self, module: Dict, module_idx: int, progress_data: ProgressData):
+    __slots__ = ("module", "module_idx", "expanded", "_materialized", "_topic_rows", "_topic_keys", "_last_title_key")
+
+    _TITLE_TMPL = "{name} - {completed}/{total} [{bar}] {pct}%"
+
+    def __init__(self, module: Dict, module_idx: int):
         super().__init__()
         self.module = module
         self.module_idx = module_idx
-        self.progress_data = progress_data
         self.expanded = (module_idx == 0)  # First module expanded by default
+        self._materialized = False
+        self._topic_rows: Dict[str, Any] = {}
+        self._topic_keys: Dict[str, Tuple] = {}
+        self._last_title_key = None
 
-    def compose(self) -> ComposeResult:
+    def _title(self) -> str:
+        """Build the module title and remember the inputs it was built from"""
         module = self.module
-        total = len(module['topics'])
-        completed = sum(1 for t in module['topics'] if t['completed'])
-        percentage = int((completed / total * 100)) if total > 0 else 0
+        completed, total, percentage = self.app.progress_data.module_stats(module['name'])
+        bar_str = _BAR10[min(10 * completed // total, 10) if total > 0 else 0]
 
-        bar_length = 10
-        filled = int(bar_length * percentage / 100)
-        bar_str = "█" * filled + "░" * (bar_length - filled)
+        self._last_title_key = (module['name'], completed, total)
+        return self._TITLE_TMPL.format(name=module['name'], completed=completed, total=total, bar=bar_str, pct=percentage)
 
+    def compose(self) -> ComposeResult:
         with Collapsible(
-            title=f"{module['name']} - {completed}/{total} [{bar_str}] {percentage}%",
+            title=self._title(),
             collapsed=not self.expanded,
             classes="module_collapsible"
         ):
-            for topic in module['topics']:
-                checkbox = "[✓]" if topic['completed'] else "[ ]"
-
-                # Show subtopics if available
-                if 'subtopics' in topic and topic['subtopics']:
-                    with Collapsible(
-                        title=f"{checkbox} {topic['name']}",
-                        collapsed=True,
-                        classes="topic_collapsible"
-                    ):
-                        for subtopic in topic['subtopics']:
-                            yield Label(f"  • {subtopic}", classes="subtopic_item")
-                else:
-                    yield Label(f"  {checkbox} {topic['name']}", classes="topic_label")
+            # Collapsed modules only get their topics once they are first expanded
+            if self.expanded:
+                self._materialized = True
+                for topic in self.module['topics']:
+                    yield self._make_topic_row(topic)
+            else:
+                yield Static("", classes="placeholder")
+
+    @on(Collapsible.Expanded, ".module_collapsible")
+    def materialize(self):
+        """Mount the module topics on first expansion"""
+        if self._materialized:
+            return
+        self._materialized = True
+        contents = self.query_one(".module_collapsible", Collapsible).query_one(Collapsible.Contents)
+        contents.query(".placeholder").remove()
+        contents.mount(*[self._make_topic_row(topic) for topic in self.module['topics']])
+
+    def _make_topic_row(self, topic: Dict):
+        """Build the row widget for a topic and remember it for in-place updates"""
+        name = topic['name']
+        completed = topic['completed']
+        subtopics = topic.get('subtopics') or ()
+        checkbox = _CHECKBOX[bool(completed)]
+
+        # Show subtopics if available
+        if subtopics:
+            row = Collapsible(
+                Static("\n".join([f"  • {subtopic}" for subtopic in subtopics]), classes="subtopic_item"),
+                title=f"{checkbox} {name}",
+                collapsed=True,
+                classes="topic_collapsible"
+            )
+        else:
+            row = Label(f"  {checkbox} {name}", classes="topic_label")
+
+        self._topic_rows[name] = row
+        self._topic_keys[name] = (completed, tuple(subtopics))
+        return row
+
+    def update_from_data(self, module: Dict):
+        """Update title and changed topic rows without recomposing"""
+        self.module = module
+        completed, total, _ = self.app.progress_data.module_stats(module['name'])
+
+        if (module['name'], completed, total) != self._last_title_key:
+            self.query_one(".module_collapsible", Collapsible).title = self._title()
+        if not self._materialized:
+            return
+
+        for topic in module['topics']:
+            key = (topic['completed'], tuple(topic.get('subtopics') or ()))
+            if self._topic_keys.get(topic['name']) == key:
+                continue
+            old_row = self._topic_rows[topic['name']]
+            new_row = self._make_topic_row(topic)
+            old_row.parent.mount(new_row, after=old_row)
+            old_row.remove()
 
 
 class CollapsibleBitLevel(Static):
     """Collapsible widget for a Bit-Systems level"""
 
-    def __init__(self, level: Dict, level_idx: int, progress_data: ProgressData):
+    def __init__(self, level: Dict, level_idx: int):
         super().__init__()
         self.level = level
         self.level_idx = level_idx
-        self.progress_data = progress_data
         self.expanded = (level_idx == 0)  # First level expanded by default
 
     def compose(self) -> ComposeResult:
         level = self.level
         solved = level['exercises_solved']
         total = level['total_exercises']
-        percentage = int((solved / total * 100)) if total > 0 else 0
+        percentage = _pct(solved, total)
         completed = level['completed']
-
-        bar_length = 10
-        filled = int(bar_length * percentage / 100)
-        bar_str = "█" * filled + "░" * (bar_length - filled)
+        bar_str = _BAR10[min(10 * solved // total, 10) if total > 0 else 0]
 
         # Mark as CRITICAL for level 4
         critical_mark = " ⚠️  CRITICAL" if level['id'] == 4 else ""
-        complete_mark = " ✓" if completed else ""
+        complete_mark = _COMPLETE_MARK[bool(completed)]
 
         with Collapsible(
             title=f"Level {level['id']}: {level['name']}{critical_mark}{complete_mark} - {solved}/{total} [{bar_str}] {percentage}%",
@@ -272,25 +642,21 @@ class CollapsibleBitLevel(Static):
 class CollapsibleProblemClass(Static):
     """Collapsible widget for a Bit-Systems problem class"""
 
-    def __init__(self, problem_class: Dict, class_idx: int, progress_data: ProgressData):
+    def __init__(self, problem_class: Dict, class_idx: int):
         super().__init__()
         self.problem_class = problem_class
         self.class_idx = class_idx
-        self.progress_data = progress_data
         self.expanded = (class_idx == 0)
 
     def compose(self) -> ComposeResult:
         pc = self.problem_class
         solved = pc['exercises_solved']
         total = pc['total_exercises']
-        percentage = int((solved / total * 100)) if total > 0 else 0
+        percentage = _pct(solved, total)
         completed = pc['completed']
+        bar_str = _BAR10[min(10 * solved // total, 10) if total > 0 else 0]
 
-        bar_length = 10
-        filled = int(bar_length * percentage / 100)
-        bar_str = "█" * filled + "░" * (bar_length - filled)
-
-        complete_mark = " ✓" if completed else ""
+        complete_mark = _COMPLETE_MARK[bool(completed)]
 
         with Collapsible(
             title=f"Class {pc['id']}: {pc['name']}{complete_mark} - {solved}/{total} [{bar_str}] {percentage}%",
@@ -307,6 +673,15 @@ class CollapsibleProblemClass(Static):
 class ViewSolutionsScreen(Screen):
     """Interactive screen for viewing saved solutions"""
 
+    __slots__ = (
+        "session_solutions", "selected_index", "current_filepath",
+        "_sol_labels", "_content_label", "_last_rendered", "_content_cache",
+    )
+
+    CONTENT_CACHE_SIZE = 64
+    MAX_DISPLAY_BYTES = 64 * 1024  # Larger files are shown truncated
+    MMAP_THRESHOLD = 16 * 1024  # Larger files are sliced out of a memory map
+
     BINDINGS = [
         Binding("up", "navigate_up", "Up", show=False),
         Binding("down", "navigate_down", "Down", show=False),
@@ -323,6 +698,11 @@ class ViewSolutionsScreen(Screen):
         self.session_solutions = session_solutions
         self.selected_index = 0
         self.current_filepath = None
+        self._sol_labels: List[Label] = []
+        self._content_label: Optional[Label] = None
+        self._last_rendered = ""
+        # filepath -> (mtime_ns, text), least recently viewed first
+        self._content_cache: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -335,7 +715,9 @@ class ViewSolutionsScreen(Screen):
                 if self.session_solutions:
                     for i, (filename, filepath) in enumerate(self.session_solutions):
                         label_text = f"{'>' if i == 0 else ' '} {i+1}. {filename}"
-                        yield Label(label_text, id=f"sol_{i}", classes="solution_item")
+                        label = Label(label_text, id=f"sol_{i}", classes="solution_item")
+                        self._sol_labels.append(label)
+                        yield label
                 else:
                     yield Label("No solutions saved yet", id="empty_message")
 
@@ -346,38 +728,67 @@ class ViewSolutionsScreen(Screen):
 
     def on_mount(self):
         """Automatically select and show first solution"""
+        self._content_label = self.query_one("#file_content", Label)
         if self.session_solutions:
             self.show_solution_at_index(0)
 
-    def update_selection_display(self):
-        """Update the visual selection indicator"""
-        for i in range(len(self.session_solutions)):
-            label = self.query_one(f"#sol_{i}", Label)
+    def update_selection_display(self, prev_index: int):
+        """Move the visual selection indicator from prev_index to the selected item"""
+        for i in (prev_index, self.selected_index):
             filename = self.session_solutions[i][0]
             prefix = ">" if i == self.selected_index else " "
-            label.update(f"{prefix} {i+1}. {filename}")
+            self._sol_labels[i].update(f"{prefix} {i+1}. {filename}")
 
     def show_solution_at_index(self, idx: int):
         """Show content of solution at given index"""
         if 0 <= idx < len(self.session_solutions):
+            prev_index = self.selected_index
             self.selected_index = idx
             filename, filepath = self.session_solutions[idx]
             self.current_filepath = filepath
 
             # Update selection display
-            self.update_selection_display()
+            self.update_selection_display(prev_index)
 
             # Read and display file content
             try:
-                with open(filepath, 'r') as f:
-                    content = f.read()
-
-                content_label = self.query_one("#file_content", Label)
-                content_label.update(f"File: {filename}\n{'='*50}\n\n{content}")
+                content = self._read_cached(filepath)
+                self._show_content(f"File: {filename}\n{'='*50}\n\n{content}")
 
             except Exception as e:
-                content_label = self.query_one("#file_content", Label)
-                content_label.update(f"Error reading file: {e}")
+                self._show_content(f"Error reading file: {e}")
+
+    def _show_content(self, text: str):
+        """Show text in the content pane unless it is already showing"""
+        if text == self._last_rendered:
+            return
+        self._last_rendered = text
+        self._content_label.update(text)
+
+    def _read_cached(self, filepath) -> str:
+        """Return file text (truncated past MAX_DISPLAY_BYTES), re-reading only when its mtime has changed"""
+        key = str(filepath)
+        st = os.stat(key)
+        mtime = st.st_mtime_ns
+        cached = self._content_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            self._content_cache.move_to_end(key)
+            return cached[1]
+
+        with open(key, 'rb') as f:
+            if st.st_size > self.MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    raw = mm[:self.MAX_DISPLAY_BYTES]
+            else:
+                raw = f.read(self.MAX_DISPLAY_BYTES)
+        content = raw.decode('utf-8', errors='replace')
+        if st.st_size > self.MAX_DISPLAY_BYTES:
+            content += f"\n… (truncated, {st.st_size - self.MAX_DISPLAY_BYTES} more bytes)"
+        self._content_cache[key] = (mtime, content)
+        self._content_cache.move_to_end(key)
+        if len(self._content_cache) > self.CONTENT_CACHE_SIZE:
+            self._content_cache.popitem(last=False)
+        return content
 
     def action_navigate_up(self):
         """Navigate to previous solution"""
@@ -395,21 +806,23 @@ class ViewSolutionsScreen(Screen):
 
     def action_edit_selected(self):
         """Edit the currently selected/viewed solution"""
-        if self.current_filepath:
-            # Suspend the app to run vim
-            with self.app.suspend():
-                subprocess.run(["vim", str(self.current_filepath)])
+        if not self.current_filepath:
+            self.notify("No solution selected", severity="warning")
+            return
 
-            # Refresh content display after editing
-            try:
-                with open(self.current_filepath, 'r') as f:
-                    content = f.read()
+        # Suspend the app to run the editor
+        with self.app.suspend():
+            subprocess.run([*_editor_cmd(), str(self.current_filepath)])
 
-                filename = Path(self.current_filepath).name
-                content_label = self.query_one("#file_content", Label)
-                content_label.update(f"File: {filename}\n{'='*50}\n\n{content}")
-            except Exception as e:
-                pass
+        # Refresh content display after editing; the mtime may not have ticked over
+        self._content_cache.pop(str(self.current_filepath), None)
+        try:
+            content = self._read_cached(self.current_filepath)
+
+            filename = Path(self.current_filepath).name
+            self._show_content(f"File: {filename}\n{'='*50}\n\n{content}")
+        except Exception as e:
+            pass
 
     def action_back(self):
         """Go back to solve mode"""
@@ -419,6 +832,11 @@ class ViewSolutionsScreen(Screen):
 class SolveModeScreen(Screen):
     """Full screen for spaced repetition practice with split-screen editor"""
 
+    __slots__ = (
+        "current_problem", "current_problem_text", "current_solution_file", "last_problem_name",
+        "_problem_label", "_code_editor",
+    )
+
     BINDINGS = [
         Binding("g", "generate", "Generate"),
         Binding("p", "problem", "Problem"),
@@ -464,14 +882,14 @@ class SolveModeScreen(Screen):
     }
     """
 
-    def __init__(self, progress_data: ProgressData):
+    def __init__(self):
         super().__init__()
-        self.progress_data = progress_data
         self.current_problem = None
         self.current_problem_text = ""  # Store problem description for toggle
         self.current_solution_file = None
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="leetcode_solve_"))
         self.last_problem_name = None  # Track last shown problem to avoid immediate repeats
+        self._problem_label: Optional[Label] = None
+        self._code_editor: Optional[TextArea] = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -500,44 +918,27 @@ class SolveModeScreen(Screen):
 
     def on_mount(self):
         """Configure editor after mounting"""
-        code_editor = self.query_one("#code_editor", TextArea)
-        code_editor.indent_width = 4
-        code_editor.indent_type = "spaces"
+        # Look these up once; the key handlers below use them on every press
+        self._problem_label = self.query_one("#problem_text", Label)
+        self._code_editor = self.query_one("#code_editor", TextArea)
+        self._code_editor.indent_width = 4
+        self._code_editor.indent_type = "spaces"
 
     def action_generate(self):
         """Generate random question from solved problems with weighted selection"""
-        solved_problems = self.progress_data.get_all_solved_problems()
+        # Weighted by days since last review, skipping the last shown problem
+        picked = self.app.progress_data.pick_random_solved(self.last_problem_name)
 
-        if not solved_problems:
-            problem_text = self.query_one("#problem_text", Label)
+        if picked is None:
+            problem_text = self._problem_label
             problem_text.update("No solved problems found. Solve some problems first!")
             return
 
-        # Filter out last shown problem to avoid immediate repeats
-        candidates = solved_problems
-        if self.last_problem_name and len(solved_problems) > 1:
-            candidates = [p for p in solved_problems if p[0] != self.last_problem_name]
-
-        # Weighted random selection based on days since last review
-        weights = []
-        for problem in candidates:
-            problem_name, pattern, url, topic_name, phase_name, phase_id = problem
-            days_since_review = self.progress_data.get_days_since_review(phase_id, topic_name, problem_name)
-
-            # Weight calculation:
-            # - Never reviewed: weight = 100 (highest priority)
-            # - 1 day ago: weight = 1
-            # - 7 days ago: weight = 7
-            # - Recently reviewed problems have lower chance
-            weight = days_since_review if days_since_review > 0 else 100
-            weights.append(weight)
-
-        # Pick problem using weighted random
-        problem_name, pattern, url, topic_name, phase_name, phase_id = random.choices(candidates, weights=weights)[0]
+        problem_name, pattern, url, topic_name, phase_name, phase_id = picked
         self.last_problem_name = problem_name  # Remember for next generation
 
         # Mark as reviewed today
-        self.progress_data.update_last_reviewed(phase_id, topic_name, problem_name)
+        self.app.progress_data.update_last_reviewed(phase_id, topic_name, problem_name)
 
         self.current_problem = {
             'name': problem_name,
@@ -549,7 +950,7 @@ class SolveModeScreen(Screen):
         }
 
         # Update problem description panel with text wrapping
-        problem_text = self.query_one("#problem_text", Label)
+        problem_text = self._problem_label
         python_template = ""
 
         if url:
@@ -588,10 +989,10 @@ class SolveModeScreen(Screen):
             self.current_problem_text = basic_info
 
         # Setup code editor with template
-        code_editor = self.query_one("#code_editor", TextArea)
-        clean_name = problem_name.replace(" ", "_").replace("(", "").replace(")", "").replace("/", "_")
+        code_editor = self._code_editor
+        clean_name = problem_name.translate(_FILENAME_TRANS)
         filename = f"{clean_name}.py"
-        self.current_solution_file = self.temp_dir / filename
+        self.current_solution_file = self.app.solve_tmp / filename
 
         # Load existing solution if available, otherwise create template
         if self.current_solution_file.exists():
@@ -648,7 +1049,7 @@ class SolveModeScreen(Screen):
             self.notify("No problem loaded", severity="warning")
             return
 
-        problem_text = self.query_one("#problem_text", Label)
+        problem_text = self._problem_label
         problem_text.update(self.current_problem_text)
         self.notify("Showing problem", severity="information")
 
@@ -678,7 +1079,7 @@ class SolveModeScreen(Screen):
         with open(solution_path) as f:
             solution_text = f.read()
 
-        problem_text = self.query_one("#problem_text", Label)
+        problem_text = self._problem_label
         problem_text.update(solution_text)
 
         self.notify("Showing solution", severity="information")
@@ -700,7 +1101,7 @@ class SolveModeScreen(Screen):
             self.notify("No problem loaded. Generate a problem first.", severity="warning")
             return
 
-        code_editor = self.query_one("#code_editor", TextArea)
+        code_editor = self._code_editor
 
         # Extract slug from URL for filename
         url = self.current_problem.get('url', '')
@@ -733,19 +1134,25 @@ class AddProblemScreen(ModalScreen[bool]):
         Binding("escape", "dismiss", "Cancel"),
     ]
 
-    def __init__(self, progress_data: ProgressData):
+    def __init__(self):
         super().__init__()
-        self.progress_data = progress_data
+        self._inputs: Optional[Tuple[Input, Input, Input]] = None
 
     def compose(self) -> ComposeResult:
+        # Field prompts are drawn as border titles rather than as separate Labels
+        phase_input = Input(placeholder="1", id="phase_input")
+        phase_input.border_title = "Phase (1-5)"
+        topic_input = Input(placeholder="Arrays, Strings, etc.", id="topic_input")
+        topic_input.border_title = "Topic"
+        problem_input = Input(placeholder="Two Sum", id="problem_input")
+        problem_input.border_title = "Problem Name"
+        self._inputs = (phase_input, topic_input, problem_input)
+
         yield Container(
             Label("Add Solved Problem", id="title"),
-            Label("Phase (1-5):"),
-            Input(placeholder="1", id="phase_input"),
-            Label("Topic:"),
-            Input(placeholder="Arrays, Strings, etc.", id="topic_input"),
-            Label("Problem Name:"),
-            Input(placeholder="Two Sum", id="problem_input"),
+            phase_input,
+            topic_input,
+            problem_input,
             Horizontal(
                 Button("Add", variant="primary", id="add_btn"),
                 Button("Cancel", variant="default", id="cancel_btn"),
@@ -757,20 +1164,20 @@ class AddProblemScreen(ModalScreen[bool]):
     @on(Button.Pressed, "#add_btn")
     def add_problem(self):
         """Handle add button press"""
-        phase_input = self.query_one("#phase_input", Input)
-        topic_input = self.query_one("#topic_input", Input)
-        problem_input = self.query_one("#problem_input", Input)
+        phase_input, topic_input, problem_input = self._inputs
 
-        try:
-            phase_id = int(phase_input.value)
-            topic_name = topic_input.value.strip()
-            problem_name = problem_input.value.strip()
-
-            if 1 <= phase_id <= 5 and topic_name and problem_name:
-                self.progress_data.add_problem(phase_id, topic_name, problem_name)
-                self.dismiss(True)
-        except ValueError:
-            pass
+        # Phases are 1-5, so a single-character check replaces int() + try/except
+        phase_value = phase_input.value.strip()
+        if len(phase_value) != 1 or phase_value not in "12345":
+            return
+
+        topic_name = topic_input.value.strip()
+        problem_name = problem_input.value.strip()
+        if not (topic_name and problem_name):
+            return
+
+        added = self.app.progress_data.add_problem(int(phase_value), topic_name, problem_name)
+        self.dismiss(added)
 
     @on(Button.Pressed, "#cancel_btn")
     def cancel(self):
@@ -784,18 +1191,32 @@ class DashboardScreen(Screen):
     BINDINGS = [
         Binding("a", "add_problem", "Add Problem"),
         Binding("r", "refresh", "Refresh"),
+        Binding("R", "reload_from_disk", "Reload"),
         Binding("s", "solve", "Solve"),
         Binding("q", "quit", "Quit"),
     ]
 
-    def __init__(self, progress_data: ProgressData):
+    REFRESH_DELAY = 0.05  # Seconds to gather repeated refreshes/adds into one widget update
+
+    def __init__(self):
         super().__init__()
-        self.progress_data = progress_data
+        self._pending_refresh = False
+        self._refresh_on_resume = False
+        self._phase_widgets: Dict[int, CollapsiblePhase] = {}
+        self._module_widgets: Dict[str, CollapsibleSystemsModule] = {}
+        self._layout_key = None
+        self._started_label: Optional[Label] = None
+        self._activity_label: Optional[Label] = None
+        self._overall_label: Optional[Label] = None
+        self._overall_bar: Optional[ProgressBar] = None
 
     def compose(self) -> ComposeResult:
         yield Header()
 
-        data = self.progress_data.data
+        data = self.app.progress_data.data
+        self._layout_key = self.layout_key(data)
+        # Everything is composed from current data, so nothing is pending
+        self.app.progress_data.pop_dirty_phase_ids()
         meta = data['meta']
         leetcode = data['leetcode']
         systems = data['systems']
@@ -804,34 +1225,39 @@ class DashboardScreen(Screen):
         # Stats header (compact)
         with Container(id="stats_header"):
             yield Label(f"Interview Prep Progress Tracker")
-            yield Label(f"Started: {meta['start_date']}\n")
-            yield Label(f"Days Active: {meta['total_days_active']}  \nStreak:  {meta['streak_days']} days")
+            self._started_label = Label(f"Started: {meta['start_date']}\n")
+            yield self._started_label
+            self._activity_label = Label(f"Days Active: {meta['total_days_active']}  \nStreak:  {meta['streak_days']} days")
+            yield self._activity_label
 
         # Main content area
         with VerticalScroll(id="main_content"):
             # LeetCode section
             yield Label("━━━ ━━━ LEETCODE PROGRESS ━━━ ━━━", classes="section_title")
 
-            total_solved = leetcode['total_solved']
-            total_target = leetcode['total_target']
-            overall_pct = int((total_solved / total_target * 100)) if total_target > 0 else 0
+            total_solved, total_target, overall_pct = self.app.progress_data.overall_stats()
 
-            yield Label(f"Overall: {total_solved}/{total_target} ({overall_pct}%)", classes="overall_label")
+            self._overall_label = Label(f"Overall: {total_solved}/{total_target} ({overall_pct}%)", classes="overall_label")
+            yield self._overall_label
 
-            overall_bar = ProgressBar(total=total_target, show_eta=False, classes="overall_progress")
-            overall_bar.update(progress=total_solved)
-            yield overall_bar
+            self._overall_bar = ProgressBar(total=total_target, show_eta=False, classes="overall_progress")
+            self._overall_bar.update(progress=total_solved)
+            yield self._overall_bar
 
             # Phases
             for i, phase in enumerate(leetcode['phases']):
-                yield CollapsiblePhase(phase, i, self.progress_data)
+                phase_widget = CollapsiblePhase(phase, i)
+                self._phase_widgets[phase['id']] = phase_widget
+                yield phase_widget
 
             # Systems section
             yield Label("━━━ ━━━ SYSTEMS PROGRESS ━━━ ━━━", classes="section_title")
 
             # Modules
             for i, module in enumerate(systems['modules']):
-                yield CollapsibleSystemsModule(module, i, self.progress_data)
+                module_widget = CollapsibleSystemsModule(module, i)
+                self._module_widgets[module['name']] = module_widget
+                yield module_widget
 
             # Bit-Systems section
             if bit_systems:
@@ -839,7 +1265,7 @@ class DashboardScreen(Screen):
 
                 levels_completed = bit_systems.get('levels_completed', 0)
                 total_levels = bit_systems.get('total_levels', 8)
-                bit_pct = int((levels_completed / total_levels * 100)) if total_levels > 0 else 0
+                bit_pct = _pct(levels_completed, total_levels)
 
                 yield Label(f"Overall: {levels_completed}/{total_levels} levels complete ({bit_pct}%)", classes="overall_label")
 
@@ -850,36 +1276,116 @@ class DashboardScreen(Screen):
                 # The 8 Levels
                 yield Label("The 8 Levels:", classes="subsection_label")
                 for i, level in enumerate(bit_systems.get('levels', [])):
-                    yield CollapsibleBitLevel(level, i, self.progress_data)
+                    yield CollapsibleBitLevel(level, i)
 
                 # Problem Classes (if unlocked)
                 if bit_systems.get('problem_classes_unlocked', False):
                     yield Label("🔓 Problem Classes (Interview Patterns):", classes="subsection_label")
                     for i, pc in enumerate(bit_systems.get('problem_classes', [])):
-                        yield CollapsibleProblemClass(pc, i, self.progress_data)
+                        yield CollapsibleProblemClass(pc, i)
                 else:
                     yield Label("🔒 Problem Classes (Complete all 8 levels to unlock)", classes="locked_label")
 
         yield Footer()
 
+    @staticmethod
+    def layout_key(data: Dict) -> Tuple:
+        """Shape of the data that the composed widget tree depends on"""
+        return (
+            tuple((p['id'], tuple(t['name'] for t in p['topics'])) for p in data['leetcode']['phases']),
+            tuple((m['name'], tuple(t['name'] for t in m['topics'])) for m in data['systems']['modules']),
+            data.get('bit_systems', {}),
+        )
+
+    def update_overall(self):
+        """Update the overall LeetCode label and progress bar"""
+        total_solved, total_target, overall_pct = self.app.progress_data.overall_stats()
+
+        self._overall_label.update(f"Overall: {total_solved}/{total_target} ({overall_pct}%)")
+        self._overall_bar.update(total=total_target, progress=total_solved)
+
     def action_add_problem(self):
         """Show add problem modal"""
-        def handle_result(added: bool):
+        def handle_result(added: Optional[bool]):
             if added:
-                self.app.pop_screen()
-                self.app.push_screen(DashboardScreen(self.progress_data))
+                self.schedule_refresh()
 
-        self.app.push_screen(AddProblemScreen(self.progress_data), handle_result)
+        self.app.push_screen(AddProblemScreen(), handle_result)
 
     def action_solve(self):
         """Show solve mode screen"""
-        self.app.push_screen(SolveModeScreen(self.progress_data))
+        self.app.push_screen(SolveModeScreen())
 
     def action_refresh(self):
-        """Refresh the dashboard"""
-        self.progress_data.data = self.progress_data.load()
-        self.app.pop_screen()
-        self.app.push_screen(DashboardScreen(self.progress_data))
+        """Refresh the dashboard from the in-memory data"""
+        self.schedule_refresh()
+
+    def action_reload_from_disk(self):
+        """Pick up edits made to progress.json outside the app"""
+        progress_data = self.app.progress_data
+        if not progress_data.changed_on_disk():
+            self.notify("progress.json unchanged")
+            return
+        # The pending write would replace whatever was loaded, so don't pretend to reload
+        if progress_data.has_pending_write:
+            self.notify(
+                "Not reloaded: in-app changes are still being saved and will overwrite the edit",
+                severity="warning"
+            )
+            return
+        progress_data.reload()
+        self.schedule_refresh()
+
+    def schedule_refresh(self):
+        """Apply the data to the widgets shortly, once per burst of requests"""
+        if self._pending_refresh:
+            return
+        self._pending_refresh = True
+        self.set_timer(self.REFRESH_DELAY, self._do_refresh)
+
+    def _do_refresh(self):
+        """Timer callback for schedule_refresh"""
+        self._pending_refresh = False
+        # Solve mode or the add modal opened in the meantime; catch up once it is dismissed
+        if self.app.screen is not self:
+            self._refresh_on_resume = True
+            return
+        self.apply_data()
+
+    def on_screen_resume(self):
+        """Apply a refresh that was deferred while another screen was on top"""
+        if self._refresh_on_resume:
+            self._refresh_on_resume = False
+            self.apply_data()
+
+    def apply_data(self):
+        """Bring the widgets in line with the current progress data"""
+        data = self.app.progress_data.data
+
+        # Structural changes (phases/topics/modules added or removed) need a full rebuild
+        if self.layout_key(data) != self._layout_key:
+            self.app.switch_screen(DashboardScreen())
+            return
+
+        meta = data['meta']
+        self._started_label.update(f"Started: {meta['start_date']}\n")
+        self._activity_label.update(
+            f"Days Active: {meta['total_days_active']}  \nStreak:  {meta['streak_days']} days"
+        )
+        self.update_dirty_phases()
+        for module in data['systems']['modules']:
+            self._module_widgets[module['name']].update_from_data(module)
+
+    def update_dirty_phases(self):
+        """Update only the phases changed since the last update, plus the overall bar"""
+        progress_data = self.app.progress_data
+        dirty = progress_data.pop_dirty_phase_ids()
+        if not dirty:
+            return
+
+        for phase_id in dirty:
+            self._phase_widgets[phase_id].update_from_data(progress_data.get_phase(phase_id))
+        self.update_overall()
 
     def action_quit(self):
         """Quit the application"""
@@ -890,14 +1396,51 @@ class ProgressTrackerApp(App):
     """Main application"""
 
     CSS_PATH = "dashboard.tcss"
+    SAVE_DELAY = 0.5  # Seconds to wait for more changes before writing progress.json
 
     def __init__(self):
         super().__init__()
-        self.progress_data = ProgressData()
+        # Loaded by _load_then_push once the app is running
+        self.progress_data: Optional[ProgressData] = None
+        self._solve_tmp: Optional[Path] = None
+
+    @property
+    def solve_tmp(self) -> Path:
+        """Scratch space shared by every solve mode session, created on first use and removed on exit"""
+        if self._solve_tmp is None:
+            self._solve_tmp = Path(tempfile.mkdtemp(prefix="leetcode_solve_"))
+            atexit.register(shutil.rmtree, self._solve_tmp, ignore_errors=True)
+        return self._solve_tmp
 
     def on_mount(self):
+        """Start loading progress data; the dashboard is pushed when it is ready"""
+        self._load_then_push()
+
+    def on_unmount(self):
+        """Make sure the last save reaches disk before exiting"""
+        if self.progress_data is not None:
+            self.progress_data.flush()
+
+    @work(thread=True)
+    def _load_then_push(self):
+        """Read progress.json off the event loop, then mount the main dashboard screen"""
+        progress_data = ProgressData()
+        progress_data.schedule_write = self._save_worker
+        self.call_from_thread(self._show_dashboard, progress_data)
+
+    def _show_dashboard(self, progress_data: ProgressData):
         """Mount the main dashboard screen"""
-        self.push_screen(DashboardScreen(self.progress_data))
+        self.progress_data = progress_data
+        self.push_screen(DashboardScreen())
+
+    @work(thread=True, exclusive=True, group="save")
+    def _save_worker(self):
+        """Write progress.json off the event loop; bursts of saves collapse into one write"""
+        # A newer save cancels this worker, so only the last one in a burst writes
+        time.sleep(self.SAVE_DELAY)
+        if get_current_worker().is_cancelled:
+            return
+        self.progress_data.flush()
 
 
 if __name__ == "__main__":